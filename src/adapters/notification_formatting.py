@@ -7,18 +7,48 @@ consistent regardless of delivery channel.
 from __future__ import annotations
 
 import html
+from functools import lru_cache
+from typing import Optional
 
 from core.models import MessageContext
 from core.rules_engine import RuleMatch
 
+_DIVIDER = "──────────────"
+_MD_ESCAPE = str.maketrans({ch: f"\\{ch}" for ch in "*[`"})
+
+
+def _escape_md(value: str) -> str:
+    return value.translate(_MD_ESCAPE)
+
+
+_LABEL_CACHE_SIZE = 1024
+_label_cache: dict[tuple[str, str, Optional[int]], str] = {}
+_label_aliases: Optional[dict[str, str]] = None
+
 
 def format_source_label(context: MessageContext, source_aliases: dict[str, str]) -> str:
     """Return a human-friendly source label, using configured aliases."""
 
-    base_key = context.base_source_key
-    effective_key = context.source_key
-    topic_id = context.topic_id
+    global _label_aliases
+
+    # The alias map is loaded once per run, so labels are cached against that map
+    # and the cache is dropped whenever a different map is passed in.
+    if source_aliases is not _label_aliases or len(_label_cache) >= _LABEL_CACHE_SIZE:
+        _label_cache.clear()
+        _label_aliases = source_aliases
+    cache_key = (context.base_source_key, context.source_key, context.topic_id)
+    label = _label_cache.get(cache_key)
+    if label is None:
+        label = _label_cache[cache_key] = _build_source_label(*cache_key, source_aliases)
+    return label
+
 
+def _build_source_label(
+    base_key: str,
+    effective_key: str,
+    topic_id: Optional[int],
+    source_aliases: dict[str, str],
+) -> str:
     if topic_id is None:
         alias = source_aliases.get(base_key) or source_aliases.get(effective_key)
         if not alias:
@@ -39,6 +69,39 @@ def format_source_label(context: MessageContext, source_aliases: dict[str, str])
     return label
 
 
+def _format_timestamp(context: MessageContext) -> str:
+    return context.date.astimezone().strftime("%H:%M:%S %d-%m-%Y").strip()
+
+
+# A message with several matches is formatted once per match with the same context
+# and snippet, so the per-message parts are escaped once and reused.
+@lru_cache(maxsize=32)
+def _markdown_context_fields(
+    context: MessageContext, snippet: str, source_label: str
+) -> tuple[str, str, str, str]:
+    links = ""
+    if context.permalink:
+        links = f"\n\n**Link:**\n{context.permalink}"
+        if context.topic_permalink and context.topic_permalink != context.permalink:
+            links += f"\n\n**Topic:**\n{context.topic_permalink}"
+    return _format_timestamp(context), _escape_md(source_label), _escape_md(snippet), links
+
+
+@lru_cache(maxsize=32)
+def _html_context_fields(
+    context: MessageContext, snippet: str, source_label: str
+) -> tuple[str, str, str, str]:
+    links = ""
+    if context.permalink:
+        safe_link = html.escape(context.permalink)
+        links = f"\n\n<b>Link:</b>\n<a href=\"{safe_link}\">{safe_link}</a>"
+        if context.topic_permalink and context.topic_permalink != context.permalink:
+            safe_topic = html.escape(context.topic_permalink)
+            links += f"\n\n<b>Topic:</b>\n<a href=\"{safe_topic}\">{safe_topic}</a>"
+    timestamp = html.escape(_format_timestamp(context))
+    return timestamp, html.escape(source_label), html.escape(snippet), links
+
+
 def _format_markdown(
     match: RuleMatch,
     context: MessageContext,
@@ -49,38 +112,24 @@ def _format_markdown(
 
     # Centralized formatting keeps notifications consistent and easy to adjust.
     # Telegram Markdown is supported by passing parse_mode="Markdown".
-    def escape_md(value: str) -> str:
-        for ch in r"*[`":
-            value = value.replace(ch, f"\\{ch}")
-        return value
-
-    timestamp = context.date.astimezone().strftime("%H:%M:%S %d-%m-%Y").strip()
-    rule_name = escape_md(match.rule_name)
-    source = escape_md(format_source_label(context, source_aliases))
-    reason = escape_md(match.reason)
-    excerpt = escape_md(snippet)
-
-    divider = "──────────────"
-
-    lines = [
-        f"[{timestamp}]",
-        f"**Rule:**   {rule_name}",
-        f"**Source:** {source}",
-        divider,
-        "",
-        excerpt,
-        "",
-        "**Why:**",
-        reason,
-    ]
-
-    if context.permalink:
-        lines.extend(["", "**Link:**", context.permalink])
-        if context.topic_permalink and context.topic_permalink != context.permalink:
-            lines.extend(["", "**Topic:**", context.topic_permalink])
-
-    lines.append(divider)
-    return "\n".join(lines)
+    timestamp, source, excerpt, links = _markdown_context_fields(
+        context, snippet, format_source_label(context, source_aliases)
+    )
+    rule_name = _escape_md(match.rule_name)
+    reason = _escape_md(match.reason)
+
+    return (
+        f"[{timestamp}]\n"
+        f"**Rule:**   {rule_name}\n"
+        f"**Source:** {source}\n"
+        f"{_DIVIDER}\n"
+        "\n"
+        f"{excerpt}\n"
+        "\n"
+        "**Why:**\n"
+        f"{reason}{links}\n"
+        f"{_DIVIDER}"
+    )
 
 
 def _format_html(
@@ -91,33 +140,24 @@ def _format_html(
 ) -> str:
     """Create the HTML notification body used by the Bot API adapter."""
 
-    timestamp = html.escape(context.date.astimezone().strftime("%H:%M:%S %d-%m-%Y").strip())
+    timestamp, source, excerpt, links = _html_context_fields(
+        context, snippet, format_source_label(context, source_aliases)
+    )
     rule_name = html.escape(match.rule_name)
-    source = html.escape(format_source_label(context, source_aliases))
     reason = html.escape(match.reason)
-    excerpt = html.escape(snippet)
-
-    parts = [
-        f"[{timestamp}]",
-        f"<b>Rule:</b> {rule_name}",
-        f"<b>Source:</b> {source}",
-        "──────────────",
-        "",
-        excerpt,
-        "",
-        "<b>Why:</b>",
-        reason,
-    ]
-
-    if context.permalink:
-        safe_link = html.escape(context.permalink)
-        parts.extend(["", "<b>Link:</b>", f"<a href=\"{safe_link}\">{safe_link}</a>"])
-        if context.topic_permalink and context.topic_permalink != context.permalink:
-            safe_topic = html.escape(context.topic_permalink)
-            parts.extend(["", "<b>Topic:</b>", f"<a href=\"{safe_topic}\">{safe_topic}</a>"])
 
-    parts.append("──────────────")
-    return "\n".join(parts)
+    return (
+        f"[{timestamp}]\n"
+        f"<b>Rule:</b> {rule_name}\n"
+        f"<b>Source:</b> {source}\n"
+        f"{_DIVIDER}\n"
+        "\n"
+        f"{excerpt}\n"
+        "\n"
+        "<b>Why:</b>\n"
+        f"{reason}{links}\n"
+        f"{_DIVIDER}"
+    )
 
 
 def format_notification(
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
 from core.models import MatchRecord, MessageContext
 
@@ -17,6 +17,8 @@ class SQLiteStorage:
 
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
+        # last_message_id writes are buffered here and persisted by flush_last_ids().
+        self._pending_last_ids: dict[str, int] = {}
 
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self._db_path)
@@ -49,7 +51,7 @@ class SQLiteStorage:
             # seen stores content fingerprints to avoid alerting on repeated
             # messages. This is optional and only used for matched content.
             # Fields:
-            # - fingerprint: SHA-256 hash of normalized content (PRIMARY KEY)
+            # - fingerprint: hex hash of normalized content, xxh3-128 or SHA-256 (PRIMARY KEY)
             # - first_seen: timestamp of first observation for TTL cleanup
             conn.execute(
                 """
@@ -90,6 +92,9 @@ class SQLiteStorage:
     def get_last_id(self, source_key: str) -> Optional[int]:
         """Return the last processed message_id for a source, if any."""
 
+        pending = self._pending_last_ids.get(source_key)
+        if pending is not None:
+            return pending
         with self._connect() as conn:
             row = conn.execute(
                 "SELECT last_message_id FROM sources_state WHERE source_key = ?",
@@ -98,17 +103,37 @@ class SQLiteStorage:
         return int(row["last_message_id"]) if row else None
 
     def set_last_id(self, source_key: str, last_message_id: int) -> None:
-        """Upsert the last processed message_id for a source."""
+        """Record the last processed message_id for a source.
 
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO sources_state (source_key, last_message_id)
-                VALUES (?, ?)
-                ON CONFLICT(source_key) DO UPDATE SET last_message_id = excluded.last_message_id
-                """,
-                (source_key, last_message_id),
-            )
+        The write is buffered in memory (and visible to get_last_id right away);
+        flush_last_ids() persists it. After a crash, at most the messages seen
+        since the last flush are processed again on restart.
+        """
+
+        self._pending_last_ids[source_key] = last_message_id
+
+    def flush_last_ids(self) -> None:
+        """Upsert all buffered last_message_id values in a single transaction."""
+
+        if not self._pending_last_ids:
+            return
+        pending = self._pending_last_ids
+        self._pending_last_ids = {}
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO sources_state (source_key, last_message_id)
+                    VALUES (?, ?)
+                    ON CONFLICT(source_key) DO UPDATE SET last_message_id = excluded.last_message_id
+                    """,
+                    pending.items(),
+                )
+        except Exception:
+            # Keep the values (unless newer ones arrived meanwhile) for the next flush.
+            for source_key, last_message_id in pending.items():
+                self._pending_last_ids.setdefault(source_key, last_message_id)
+            raise
 
     def is_seen(self, fingerprint: str) -> bool:
         """Check if a fingerprint has already been recorded."""
@@ -133,12 +158,37 @@ class SQLiteStorage:
                 (fingerprint, now.isoformat()),
             )
 
+    def try_mark_seen(self, fingerprint: str) -> bool:
+        """Record a fingerprint; return False if it was already recorded.
+
+        One INSERT OR IGNORE replaces the is_seen/mark_seen round trips; the
+        rowcount tells whether the row was new (works on any SQLite version).
+        """
+
+        now = datetime.now(timezone.utc)
+        with self._connect() as conn:
+            cur = conn.execute(
+                """
+                INSERT OR IGNORE INTO seen (fingerprint, first_seen)
+                VALUES (?, ?)
+                """,
+                (fingerprint, now.isoformat()),
+            )
+            return cur.rowcount == 1
+
     def save_match(self, context: MessageContext, match: MatchRecord) -> None:
         """Persist a match to the append-only matches table."""
 
-        created_at = datetime.now(timezone.utc)
+        self.save_matches(context, [match])
+
+    def save_matches(self, context: MessageContext, matches: Sequence[MatchRecord]) -> None:
+        """Persist all matches for one message in a single transaction."""
+
+        if not matches:
+            return
+        date = context.date.isoformat()
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO matches (
                     source_key,
@@ -151,16 +201,19 @@ class SQLiteStorage:
                     permalink
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    context.source_key,
-                    context.chat_id,
-                    context.message_id,
-                    context.date.isoformat(),
-                    match.rule_name,
-                    match.reason,
-                    match.text_snippet,
-                    context.permalink
-                ),
+                [
+                    (
+                        context.source_key,
+                        context.chat_id,
+                        context.message_id,
+                        date,
+                        match.rule_name,
+                        match.reason,
+                        match.text_snippet,
+                        context.permalink,
+                    )
+                    for match in matches
+                ],
             )
 
     def cleanup_seen(self, ttl_days: int) -> int:
@@ -179,4 +232,4 @@ class SQLiteStorage:
 
         with self._connect() as conn:
             rows = conn.execute("SELECT source_key FROM sources_state").fetchall()
-        return {row["source_key"] for row in rows}
+        return {row["source_key"] for row in rows} | self._pending_last_ids.keys()
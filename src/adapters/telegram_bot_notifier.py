@@ -5,6 +5,7 @@ Uses the Bot API for delivery so notifications can be routed via a bot chat.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import urllib.request
 
@@ -38,11 +39,15 @@ class TelegramBotNotifier:
         data = json.dumps(payload).encode("utf-8")
         request = urllib.request.Request(self._endpoint(), data=data, method="POST")
         request.add_header("Content-Type", "application/json")
-        # We use a blocking HTTP call because this is a lightweight MVP; the
-        # adapter boundary makes it easy to swap for an async client later.
-        try:
-            with urllib.request.urlopen(request, timeout=10):
-                pass
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"Bot API error {e.code}: {body}") from e
+        # urllib keeps the adapter dependency-free; running it in a worker thread
+        # keeps the event loop free and lets concurrent sends overlap.
+        await asyncio.to_thread(_post, request)
+
+
+def _post(request: urllib.request.Request) -> None:
+    try:
+        with urllib.request.urlopen(request, timeout=10):
+            pass
+    except urllib.error.HTTPError as e:
+        body = e.read().decode("utf-8", errors="replace")
+        raise RuntimeError(f"Bot API error {e.code}: {body}") from e
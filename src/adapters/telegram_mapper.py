@@ -34,17 +34,30 @@ class ForumResolver:
         return is_forum
 
 
+def _chat_username(message: Message) -> Optional[str]:
+    # Runs for every incoming update, including ignored ones, so bail out early
+    # for chats without an entity or username.
+    chat = getattr(message, "chat", None)
+    if chat is None:
+        return None
+    username = getattr(chat, "username", None)
+    if username and isinstance(username, str):
+        return username
+    return None
+
+
 def source_key_from_message(message: Message) -> str:
     """Normalize a source key using a single rule enforced across the app."""
 
-    chat = getattr(message, "chat", None)
-    username = getattr(chat, "username", None)
+    return _source_key(_chat_username(message), message.chat_id)
+
 
-    if isinstance(username, str) and username:
+def _source_key(username: Optional[str], chat_id: int) -> str:
+    if username:
         return f"@{username.lower()}"
 
     # Fallback: always stable and universal
-    return f"chat_id:{message.chat_id}"
+    return f"chat_id:{chat_id}"
 
 
 def _topic_id_from_message(message: Message) -> Optional[int]:
@@ -57,24 +70,38 @@ def _topic_id_from_message(message: Message) -> Optional[int]:
     return getattr(reply_to, "reply_to_msg_id", None)
 
 
-def _build_topic_permalink(message: Message, topic_id: int) -> Optional[str]:
-    if message.chat and getattr(message.chat, "username", None):
-        return f"https://t.me/{message.chat.username}/{topic_id}"
-
-    peer_id = message.peer_id
+def _build_permalink(username: Optional[str], peer_id, target_id: int) -> Optional[str]:
+    # Prefer public usernames for permalinks when available.
+    if username:
+        return f"https://t.me/{username}/{target_id}"
     if not peer_id:
         return None
+    # Private groups/supergroups/channels can use the /c/ links.
     if isinstance(peer_id, PeerChannel):
-        return f"https://t.me/c/{peer_id.channel_id}/{topic_id}"
+        return f"https://t.me/c/{peer_id.channel_id}/{target_id}"
     if isinstance(peer_id, PeerChat):
-        return f"https://t.me/c/{peer_id.chat_id}/{topic_id}"
+        return f"https://t.me/c/{peer_id.chat_id}/{target_id}"
+    # PeerUser has no chat/channel id; no permalink is possible.
     return None
 
 
-async def build_context(message: Message, forum_resolver: Optional[ForumResolver] = None) -> MessageContext:
-    """Build a core MessageContext from a Telethon Message."""
+async def build_context(
+    message: Message,
+    forum_resolver: Optional[ForumResolver] = None,
+    *,
+    base_source_key: Optional[str] = None,
+    text: Optional[str] = None,
+) -> MessageContext:
+    """Build a core MessageContext from a Telethon Message.
+
+    Callers that already computed the base source key or raw text for a pre-check
+    can pass them to avoid recomputing.
+    """
 
-    base_source_key = source_key_from_message(message)
+    # Resolve the chat username once; it feeds both the source key and the permalinks.
+    username = _chat_username(message)
+    if base_source_key is None:
+        base_source_key = _source_key(username, message.chat_id)
     topic_id = _topic_id_from_message(message)
     if topic_id is None and forum_resolver is not None:
         # Determine if the chat is forum-enabled to distinguish "General" from non-forum chats.
@@ -82,24 +109,14 @@ async def build_context(message: Message, forum_resolver: Optional[ForumResolver
         if is_forum_chat:
             topic_id = None
     effective_source_key = build_effective_source_key(base_source_key, topic_id)
-    text = message.raw_text or ""
+    if text is None:
+        text = message.raw_text or ""
 
-    permalink = None
-    topic_permalink = None
     peer_id = message.peer_id
-    # Prefer public usernames for permalinks when available.
-    if message.chat and getattr(message.chat, "username", None):
-        permalink = f"https://t.me/{message.chat.username}/{message.id}"
-    elif peer_id:
-        # Private groups/supergroups/channels can use the /c/ links.
-        if isinstance(peer_id, PeerChannel):
-            permalink = f"https://t.me/c/{peer_id.channel_id}/{message.id}"
-        elif isinstance(peer_id, PeerChat):
-            permalink = f"https://t.me/c/{peer_id.chat_id}/{message.id}"
-        # PeerUser has no chat/channel id; no permalink is possible.
-
+    permalink = _build_permalink(username, peer_id, message.id)
+    topic_permalink = None
     if topic_id is not None:
-        topic_permalink = _build_topic_permalink(message, topic_id)
+        topic_permalink = _build_permalink(username, peer_id, topic_id)
 
     return MessageContext(
         source_key=effective_source_key,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
 from logging.handlers import RotatingFileHandler
@@ -13,7 +14,7 @@ from dotenv import load_dotenv
 from telethon import events
 import settings
 from adapters.sqlite_storage import SQLiteStorage
-from adapters.telegram_mapper import ForumResolver, build_context
+from adapters.telegram_mapper import ForumResolver, build_context, source_key_from_message
 from adapters.telegram_bot_notifier import TelegramBotNotifier
 from adapters.telegram_notifier import TelegramSavedMessagesNotifier
 from client import build_client
@@ -25,6 +26,8 @@ from get_session import authorize
 
 NAME = "TELESCOPE"
 FONT = "tarty-1"
+# Buffered last_message_id writes are persisted at most this long after they happen.
+LAST_ID_FLUSH_SECONDS = 0.2
 
 
 def _print_banner() -> None:
@@ -159,7 +162,13 @@ async def _catch_up_scan(
         for message in reversed(messages):
             messages_checked += 1
             max_id_seen = max(max_id_seen, message.id)
-            context = await build_context(message, forum_resolver)
+            base_source_key = source_key_from_message(message)
+            text = message.raw_text or ""
+            if not processor.accepts(base_source_key, text):
+                continue
+            context = await build_context(
+                message, forum_resolver, base_source_key=base_source_key, text=text
+            )
             await processor.handle(context)
 
         # Always update to the newest message id we touched to avoid repeats.
@@ -177,6 +186,17 @@ async def _catch_up_scan(
     )
 
 
+async def _flush_last_ids_periodically(storage: SQLiteStorage) -> None:
+    """Persist buffered last_message_id updates in one transaction per tick."""
+
+    while True:
+        await asyncio.sleep(LAST_ID_FLUSH_SECONDS)
+        try:
+            storage.flush_last_ids()
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to persist last message ids")
+
+
 def _run() -> None:
     _print_banner()
     _configure_logging()
@@ -243,36 +263,56 @@ def _run() -> None:
         snippet_chars=settings.SNIPPET_CHARS,
     )
     forum_resolver = ForumResolver(client)
-    client.loop.run_until_complete(
-        _catch_up_scan(
-            client,
-            storage,
-            catch_up_processor,
-            catch_up_notifier,
-            forum_resolver,
+    # Buffered last_message_id writes are flushed from the first catch-up message
+    # until shutdown, however the run ends (Ctrl+C, a failed scan, disconnect).
+    flush_task = client.loop.create_task(_flush_last_ids_periodically(storage))
+    try:
+        client.loop.run_until_complete(
+            _catch_up_scan(
+                client,
+                storage,
+                catch_up_processor,
+                catch_up_notifier,
+                forum_resolver,
+            )
         )
-    )
 
-    # Single handler keeps Telethon integration minimal and defers all filtering
-    # to our core processor for consistency and testability.
-    @client.on(events.NewMessage(incoming=True))
-    async def handler(event) -> None:
-        try:
-            # When using bot notifications, ignore bot-sent messages to avoid
-            # loops or accidental processing of our own alerts.
-            if settings.NOTIFICATION_METHOD == "bot":
-                sender = await event.get_sender()
-                if event.is_private and sender and getattr(sender, "bot", False):
+        # Single handler keeps Telethon integration minimal and defers all filtering
+        # to our core processor for consistency and testability.
+        ignore_bot_senders = settings.NOTIFICATION_METHOD == "bot"
+
+        @client.on(events.NewMessage(incoming=True))
+        async def handler(event) -> None:
+            try:
+                message = event.message
+                # Drop untracked chats and media-only messages before any awaits or
+                # permalink/context construction.
+                base_source_key = source_key_from_message(message)
+                text = message.raw_text or ""
+                if not processor.accepts(base_source_key, text):
                     return
-            context = await build_context(event.message, forum_resolver)
-            await processor.handle(context)
-        except Exception:
-            logger.exception("Error while processing message")
-
-    # Explicit lifecycle management makes start/shutdown behavior obvious.
-    client.start()
-    logger.info("Client connected. Listening for incoming messages...")
-    client.run_until_disconnected()
+                # When using bot notifications, ignore bot-sent messages to avoid
+                # loops or accidental processing of our own alerts. Only private chats
+                # can be the bot's, so the sender fetch is skipped everywhere else.
+                if ignore_bot_senders and event.is_private:
+                    sender = await event.get_sender()
+                    if sender and getattr(sender, "bot", False):
+                        return
+                context = await build_context(
+                    message, forum_resolver, base_source_key=base_source_key, text=text
+                )
+                await processor.handle(context)
+            except Exception:
+                logger.exception("Error while processing message")
+
+        # Explicit lifecycle management makes start/shutdown behavior obvious.
+        client.start()
+        logger.info("Client connected. Listening for incoming messages...")
+        client.run_until_disconnected()
+    finally:
+        flush_task.cancel()
+        client.loop.run_until_complete(asyncio.gather(flush_task, return_exceptions=True))
+        storage.flush_last_ids()
 
 
 def _setup() -> None:
@@ -3,18 +3,33 @@
 from __future__ import annotations
 
 import hashlib
-import re
 from typing import Optional
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
-def _collapse_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+# Fingerprints are local dedup keys, not security boundaries, so a fast
+# non-cryptographic 128-bit hash is preferred when available.
+_new_hasher = xxhash.xxh3_128 if xxhash is not None else hashlib.sha256
+
+# Encoded "<source_key>\n" prefixes; source keys come from a small, stable config set.
+_SOURCE_PREFIXES: dict[str, bytes] = {}
 
 
 def normalize_for_fingerprint(text: str) -> str:
     """Normalize text for deterministic fingerprinting."""
 
-    return _collapse_whitespace(text).lower()
+    # str.split() uses the same Unicode whitespace set as re's \s and also trims the ends.
+    # Lowercasing after the collapse works on the shorter string.
+    return " ".join(text.split()).lower()
+
+
+def normalize_lowered_for_fingerprint(lowered_text: str) -> str:
+    """Same as normalize_for_fingerprint, for text the caller already lowercased."""
+
+    return " ".join(lowered_text.split())
 
 
 def compute_fingerprint(source_key: str, normalized_text: str, mode: str) -> Optional[str]:
@@ -24,10 +39,15 @@ def compute_fingerprint(source_key: str, normalized_text: str, mode: str) -> Opt
         return None
 
     if mode == "global":
-        payload = normalized_text
+        hasher = _new_hasher()
     elif mode == "per_source":
-        payload = f"{source_key}\n{normalized_text}"
+        # Feed the prefix separately instead of building a concatenated copy of the text.
+        prefix = _SOURCE_PREFIXES.get(source_key)
+        if prefix is None:
+            prefix = _SOURCE_PREFIXES[source_key] = f"{source_key}\n".encode("utf-8")
+        hasher = _new_hasher(prefix)
     else:
         raise ValueError(f"Unsupported dedup mode: {mode}")
 
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    hasher.update(normalized_text.encode("utf-8"))
+    return hasher.hexdigest()
@@ -6,7 +6,7 @@ that the core can be reused with different backends.
 
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Sequence
 
 from core.models import MatchRecord, MessageContext
 from core.rules_engine import RuleMatch
@@ -27,9 +27,15 @@ class StoragePort(Protocol):
     def mark_seen(self, fingerprint: str) -> None:
         ...
 
+    def try_mark_seen(self, fingerprint: str) -> bool:
+        ...
+
     def save_match(self, context: MessageContext, match: MatchRecord) -> None:
         ...
 
+    def save_matches(self, context: MessageContext, matches: Sequence[MatchRecord]) -> None:
+        ...
+
 
 class NotifierPort(Protocol):
     """Notification operations required by the core pipeline."""
@@ -6,17 +6,23 @@ notifications, enabling future frontends or adapters without changes here.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Iterable
 
 from core.config import DedupConfig
-from core.dedup import compute_fingerprint, normalize_for_fingerprint
+from core.dedup import compute_fingerprint, normalize_lowered_for_fingerprint
 from core.models import MatchRecord, MessageContext
 from core.ports import NotifierPort, StoragePort
-from core.rules_engine import Rule, match_rules
+from core.rules_engine import Rule, RuleMatch, build_keyword_index, match_rules
+from core.source_keys import split_source_key
 
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound on notifications in flight at once, across all messages handled by
+# one processor. Kept under Telegram's ~30 messages/second send limit.
+MAX_CONCURRENT_SENDS = 25
+
 
 class MessageProcessor:
     """Orchestrates matching, dedup, persistence, and notifications."""
@@ -26,29 +32,41 @@ class MessageProcessor:
         rules: Iterable[Rule],
         storage: StoragePort,
         notifier: NotifierPort,
-        allowed_sources: set[str],
+        allowed_sources: Iterable[str],
         dedup_config: DedupConfig,
         snippet_chars: int,
+        max_concurrent_sends: int = MAX_CONCURRENT_SENDS,
     ) -> None:
         self._rules = list(rules)
+        self._keyword_index = build_keyword_index(self._rules)
         self._storage = storage
         self._notifier = notifier
-        self._allowed_sources = allowed_sources
-        self._dedup = dedup_config
+        self._allowed_sources = frozenset(allowed_sources)
+        # Topic-scoped keys still admit their base chat at the pre-check stage.
+        self._allowed_bases = frozenset(split_source_key(key)[0] for key in self._allowed_sources)
+        # Bound once so the per-message path avoids repeated attribute lookups.
+        self._dedup_mode = dedup_config.mode
+        self._dedup_enabled = dedup_config.mode != "off" and dedup_config.only_on_match
         self._snippet_chars = snippet_chars
+        self._send_slots = asyncio.Semaphore(max_concurrent_sends)
+
+    def accepts(self, base_source_key: str, text: str) -> bool:
+        """Cheap pre-check so adapters can drop messages before building a context."""
+
+        return base_source_key in self._allowed_bases and _has_text(text)
 
     async def handle(self, context: MessageContext) -> None:
         """Process one message context through the core pipeline."""
 
-        if context.source_key in self._allowed_sources:
-            pass
-        elif context.base_source_key in self._allowed_sources:
-            pass
-        else:
+        allowed_sources = self._allowed_sources
+        if (
+            context.source_key not in allowed_sources
+            and context.base_source_key not in allowed_sources
+        ):
             return
 
         # Media-only messages without captions are ignored
-        if not context.text.strip():
+        if not _has_text(context.text):
             return
 
         # Message-level idempotency: Telegram message ids are monotonically increasing
@@ -57,37 +75,49 @@ class MessageProcessor:
         if context.message_id <= last_id:
             return
         # Rule evaluation uses the original text for regex accuracy, while keyword
-        # checks are case-insensitive inside the rule engine.
-        matches = match_rules(context.text, self._rules)
+        # checks are case-insensitive inside the rule engine. The lowered text is
+        # shared with fingerprinting so it is only computed once.
+        lowered = context.text.lower()
+        matches = match_rules(context.text, self._rules, self._keyword_index, lowered)
         if not matches:
             self._storage.set_last_id(context.source_key, context.message_id)
             return
 
         # Content-level dedup is optional and only used when we already have a match.
         # avoids polluting the dedup table with irrelevant messages.
-        normalized_text = normalize_for_fingerprint(context.text)
-        fingerprint = compute_fingerprint(context.source_key, normalized_text, self._dedup.mode)
-        if fingerprint and self._dedup.only_on_match:
-            if self._storage.is_seen(fingerprint):
+        # Normalizing is skipped entirely when the fingerprint would go unused.
+        if self._dedup_enabled:
+            normalized_text = normalize_lowered_for_fingerprint(lowered)
+            fingerprint = compute_fingerprint(context.source_key, normalized_text, self._dedup_mode)
+            if fingerprint and not self._storage.try_mark_seen(fingerprint):
                 LOGGER.info("Dedup skip for %s (same message)", context.source_key)
                 self._storage.set_last_id(context.source_key, context.message_id)
                 return
-            self._storage.mark_seen(fingerprint)
 
         # Snippet is clipped to reduce notification noise and to keep the DB row
         # reasonably small without losing the gist of the match.
         snippet = context.text[: self._snippet_chars].strip()
+        self._storage.save_matches(
+            context,
+            [
+                MatchRecord(rule_name=match.rule_name, reason=match.reason, text_snippet=snippet)
+                for match in matches
+            ],
+        )
         for match in matches:
-            self._storage.save_match(
-                context,
-                MatchRecord(
-                    rule_name=match.rule_name,
-                    reason=match.reason,
-                    text_snippet=snippet,
-                ),
-            )
-            await self._notifier.send(context, match, snippet)
             LOGGER.info("Match saved for %s (%s)", context.source_key, match.rule_name)
+        # Storage is local; notifications are network round-trips, so overlap them.
+        await asyncio.gather(*(self._send(context, match, snippet) for match in matches))
 
         # Update the last_message_id after all match handling to ensure restart safety.
         self._storage.set_last_id(context.source_key, context.message_id)
+
+    async def _send(self, context: MessageContext, match: RuleMatch, snippet: str) -> None:
+        async with self._send_slots:
+            await self._notifier.send(context, match, snippet)
+
+
+def _has_text(text: str) -> bool:
+    # isspace() stops at the first non-space character and allocates nothing,
+    # unlike building a stripped copy; an empty string is not "space".
+    return bool(text) and not text.isspace()
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Iterable, List
+from typing import Iterable, List, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 @dataclass(frozen=True)
@@ -26,6 +32,17 @@ class RuleMatch:
     reason: str
 
 
+@lru_cache(maxsize=4096)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a rule regex, reusing the result for identical patterns.
+
+    Editors validate patterns as they are typed, so by the time rules are
+    built most patterns are already compiled. Raises re.error when invalid.
+    """
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def build_rules(rules_config: Iterable[dict]) -> List[Rule]:
     """Normalize rule configs and compile regex patterns.
 
@@ -40,7 +57,7 @@ def build_rules(rules_config: Iterable[dict]) -> List[Rule]:
         keywords = [k.lower() for k in rule.get("keywords", [])]
         exclude_keywords = [k.lower() for k in rule.get("exclude_keywords", [])]
         raw_regex = rule.get("regex", []) or []
-        regex_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in raw_regex]
+        regex_patterns = [compile_pattern(pattern) for pattern in raw_regex]
         compiled.append(
             Rule(
                 name=rule["name"],
@@ -53,23 +70,78 @@ def build_rules(rules_config: Iterable[dict]) -> List[Rule]:
     return compiled
 
 
-def match_rules(text: str, rules: Iterable[Rule]) -> List[RuleMatch]:
+class KeywordIndex:
+    """Find which of a fixed set of lowercase keywords occur in a text.
+
+    With pyahocorasick installed, all keywords are found in one pass over the
+    text; otherwise each distinct keyword is searched once, however many rules
+    share it.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._keywords = frozenset(keywords)
+        self._automaton = None
+        if ahocorasick is not None and any(self._keywords):
+            automaton = ahocorasick.Automaton()
+            for keyword in self._keywords:
+                if keyword:
+                    automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, lowered: str) -> set[str]:
+        """Return the keywords present in already-lowercased text."""
+
+        if self._automaton is None:
+            return {keyword for keyword in self._keywords if keyword in lowered}
+        # The empty keyword matches everything, as with the `in` operator.
+        found = {""} if "" in self._keywords else set()
+        found.update(keyword for _, keyword in self._automaton.iter(lowered))
+        return found
+
+
+def build_keyword_index(rules: Iterable[Rule]) -> KeywordIndex:
+    """Index every include and exclude keyword of the given rules."""
+
+    return KeywordIndex(
+        keyword
+        for rule in rules
+        for keyword in (*rule.keywords, *rule.exclude_keywords)
+    )
+
+
+def match_rules(
+    text: str,
+    rules: Iterable[Rule],
+    keyword_index: Optional[KeywordIndex] = None,
+    lowered: Optional[str] = None,
+) -> List[RuleMatch]:
     """Return all rule matches for the given text.
 
     Matching logic:
     - If any exclude keyword is present, the rule does not match.
     - Otherwise, any keyword OR any regex match is sufficient.
     - Reasons include the specific keywords and/or regex patterns that matched.
+
+    Callers matching many messages against the same rules can pass a
+    KeywordIndex built from them to scan the text once for all keywords, and
+    ``lowered`` when they already hold ``text.lower()``.
     """
 
-    lowered = text.lower()
+    if lowered is None:
+        lowered = text.lower()
     matches: List[RuleMatch] = []
+    present = keyword_index.find(lowered) if keyword_index is not None else None
 
     for rule in rules:
-        if any(ex in lowered for ex in rule.exclude_keywords):
-            continue
-
-        keyword_hits = [k for k in rule.keywords if k in lowered]
+        if present is None:
+            if any(ex in lowered for ex in rule.exclude_keywords):
+                continue
+            keyword_hits = [k for k in rule.keywords if k in lowered]
+        else:
+            if any(ex in present for ex in rule.exclude_keywords):
+                continue
+            keyword_hits = [k for k in rule.keywords if k in present]
         regex_hits = [pattern.pattern for pattern in rule.regex_patterns if pattern.search(text)]
 
         if not keyword_hits and not regex_hits:
@@ -92,12 +92,14 @@ class ConfigPanelApp(App):
         self._save_config()
 
     def action_reload_config(self) -> None:
+        self._flush_pending_edits()
         if self.config_state.dirty:
             self.push_screen(ReloadConfirmScreen(), self._handle_reload_choice)
         else:
             self._load_config()
 
     def action_request_quit(self) -> None:
+        self._flush_pending_edits()
         if self.config_state.dirty:
             self.push_screen(UnsavedChangesScreen(), self._handle_exit_choice)
         else:
@@ -147,6 +149,7 @@ class ConfigPanelApp(App):
         self._refresh_settings_tab()
 
     def _save_config(self) -> bool:
+        self._flush_pending_edits()
         if self.config_state.data is None:
             self.config_state.error = "Nothing to save"
             self._refresh_header()
@@ -204,6 +207,14 @@ class ConfigPanelApp(App):
             return
         settings_tab.reload_from_config()
 
+    def _flush_pending_edits(self) -> None:
+        for tab_type in (SourcesTab, SettingsTab):
+            try:
+                tab = self.query_one(tab_type)
+            except Exception:
+                continue
+            tab.flush_pending_updates()
+
     def update_config_section(self, section: str, value: Any) -> None:
         """Update a config section in memory and mark dirty."""
         if self.config_state.data is None:
@@ -211,6 +222,28 @@ class ConfigPanelApp(App):
         self.config_state.data[section] = value
         self.mark_dirty()
 
+    def patch_config(self, path: tuple[Any, ...], value: Any) -> bool:
+        """Update a single leaf of the config in memory and mark dirty.
+
+        Per-keystroke edits use this instead of re-submitting a whole section;
+        writing the value that is already stored is a no-op. Returns whether
+        the config changed.
+        """
+        if self.config_state.data is None:
+            self.config_state.data = {}
+        *parents, leaf = path
+        target: Any = self.config_state.data
+        for key in parents:
+            target = target[key]
+        try:
+            if target[leaf] == value:
+                return False
+        except (KeyError, IndexError):
+            pass
+        target[leaf] = value
+        self.mark_dirty()
+        return True
+
     @staticmethod
     def _title_text() -> Text:
         return Text.assemble(
@@ -2,24 +2,40 @@
 
 from __future__ import annotations
 
+import io
+import re
 from typing import Any, Iterable, Optional
 
-from textual import on
+from textual import on, work
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, DataTable, Input, Static, Switch, TextArea
+from textual.worker import get_current_worker
 
-from core.rules_engine import build_rules, match_rules
+from core.rules_engine import Rule, RuleMatch, build_rules, compile_pattern, match_rules
 from ..modals import DeleteRuleScreen
 
+_NONBLANK_LINE = re.compile(r"[^\r\n]+")
+
+
+def _parse_lines(value: str) -> list[str]:
+    """Return stripped, non-empty lines from a TextArea buffer."""
+
+    return [line for raw in _NONBLANK_LINE.findall(value) if (line := raw.strip())]
+
 
 class RulesTab(Container):
     """Rules tab for editing config.rules and testing rules."""
 
+    MAX_TEST_MATCHES = 200
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._loading_form = False
         self._current_row_key: Optional[str] = None
         self._table_ready = False
+        self._compiled_rules: Optional[list[Rule]] = None
+        self._rules_version = 0
+        self._regex_error_shown = False
 
     def compose(self):
         with Vertical(id="rules-panel"):
@@ -52,7 +68,18 @@ class RulesTab(Container):
                 yield Button("Delete rule", id="delete-rule", variant="error")
 
     def on_mount(self) -> None:
-        table = self.query_one("#rules-table", DataTable)
+        # Resolve widgets once; handlers run per keystroke and should not walk the DOM.
+        self._table = self.query_one("#rules-table", DataTable)
+        self._name_input = self.query_one("#rule-name", Input)
+        self._enabled_toggle = self.query_one("#rule-enabled", Switch)
+        self._keywords_input = self.query_one("#rule-keywords", TextArea)
+        self._excludes_input = self.query_one("#rule-excludes", TextArea)
+        self._regex_input = self.query_one("#rule-regex", TextArea)
+        self._test_text = self.query_one("#rule-test-text", TextArea)
+        self._test_result = self.query_one("#rule-test-result", Static)
+        self._delete_btn = self.query_one("#delete-rule", Button)
+        self._duplicate_btn = self.query_one("#duplicate-rule", Button)
+        table = self._table
         table.add_column("enabled", key="enabled", width=8)
         table.add_column("name", key="name", width=38)
         table.add_column("badges", key="badges", width=26)
@@ -65,7 +92,8 @@ class RulesTab(Container):
     def reload_from_config(self) -> None:
         if not self._table_ready:
             return
-        table = self.query_one("#rules-table", DataTable)
+        self._invalidate_compiled_rules()
+        table = self._table
         table.clear()
         for index, rule, badges in self._iter_rules():
             row_key = str(index)
@@ -92,14 +120,32 @@ class RulesTab(Container):
         return []
 
     def _set_rules(self, rules: list[dict[str, Any]]) -> None:
+        self._invalidate_compiled_rules()
         self.app.update_config_section("rules", rules)
 
+    def _patch_rule(self, index: int, field: str, value: Any) -> None:
+        if self.app.patch_config(("rules", index, field), value):
+            self._invalidate_compiled_rules()
+
+    def _invalidate_compiled_rules(self) -> None:
+        # The tester keeps compiled rules until a rule changes so repeated Test clicks
+        # with new text skip the clone + regex compile pass.
+        self._compiled_rules = None
+        self._rules_version += 1
+
+    def _tester_rules(self) -> list[dict[str, Any]]:
+        enabled_override = []
+        for rule in self._get_rules():
+            clone = dict(rule)
+            clone.setdefault("name", "(unnamed rule)")
+            clone["enabled"] = True
+            enabled_override.append(clone)
+        return enabled_override
+
     def _update_action_state(self) -> None:
-        delete_btn = self.query_one("#delete-rule", Button)
-        duplicate_btn = self.query_one("#duplicate-rule", Button)
         has_selection = self._current_row_key is not None
-        delete_btn.disabled = not has_selection
-        duplicate_btn.disabled = not has_selection
+        self._delete_btn.disabled = not has_selection
+        self._duplicate_btn.disabled = not has_selection
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         self._current_row_key = self._coerce_row_key(event.row_key)
@@ -116,8 +162,7 @@ class RulesTab(Container):
         rules = self._get_rules()
         if index >= len(rules):
             return
-        rules[index]["name"] = event.value
-        self._set_rules(rules)
+        self._patch_rule(index, "name", event.value)
         self._update_table_cell(index, "name", event.value)
 
     @on(Switch.Changed, "#rule-enabled")
@@ -130,8 +175,7 @@ class RulesTab(Container):
         rules = self._get_rules()
         if index >= len(rules):
             return
-        rules[index]["enabled"] = bool(event.value)
-        self._set_rules(rules)
+        self._patch_rule(index, "enabled", bool(event.value))
         self._update_table_cell(index, "enabled", "yes" if event.value else "no")
 
     @on(TextArea.Changed, "#rule-keywords")
@@ -156,11 +200,25 @@ class RulesTab(Container):
         rules = self._get_rules()
         if index >= len(rules):
             return
-        raw_lines = [line.strip() for line in event.text_area.text.splitlines()]
-        regex_list = [line for line in raw_lines if line]
-        rules[index]["regex"] = regex_list
-        self._set_rules(rules)
+        regex_list = _parse_lines(event.text_area.text)
+        self._patch_rule(index, "regex", regex_list)
         self._update_table_cell(index, "badges", self._badge_for_rule(rules[index]))
+        self._validate_regex_lines(regex_list)
+
+    def _validate_regex_lines(self, patterns: list[str]) -> None:
+        # Compiling here warms the shared pattern cache, so Test only compiles changed lines.
+        errors = []
+        for pattern in patterns:
+            try:
+                compile_pattern(pattern)
+            except re.error as exc:
+                errors.append(f"- {pattern}: {exc}")
+        if errors:
+            self._test_result.update("Invalid regex:\n" + "\n".join(errors))
+            self._regex_error_shown = True
+        elif self._regex_error_shown:
+            self._test_result.update("")
+            self._regex_error_shown = False
 
     def _update_lines_field(self, value: str, field: str) -> None:
         index = self._current_index()
@@ -169,9 +227,8 @@ class RulesTab(Container):
         rules = self._get_rules()
         if index >= len(rules):
             return
-        parsed = [line.strip() for line in value.splitlines() if line.strip()]
-        rules[index][field] = parsed
-        self._set_rules(rules)
+        parsed = _parse_lines(value)
+        self._patch_rule(index, field, parsed)
         self._update_table_cell(index, "badges", self._badge_for_rule(rules[index]))
 
     @on(Button.Pressed, "#add-rule")
@@ -226,8 +283,9 @@ class RulesTab(Container):
 
     @on(Button.Pressed, "#rule-test")
     def _on_test_rule(self) -> None:
-        test_text = self.query_one("#rule-test-text", TextArea).text
-        result = self.query_one("#rule-test-result", Static)
+        test_text = self._test_text.text
+        result = self._test_result
+        self._regex_error_shown = False
         rules = self._get_rules()
         if not test_text.strip():
             result.update("Add test text to run.")
@@ -235,30 +293,66 @@ class RulesTab(Container):
         if not rules:
             result.update("No rules configured.")
             return
-        enabled_override = []
-        for rule in rules:
-            clone = dict(rule)
-            clone.setdefault("name", "(unnamed rule)")
-            clone["enabled"] = True
-            enabled_override.append(clone)
-        compiled = build_rules(enabled_override)
-        matches = match_rules(test_text, compiled)
-        if not matches:
-            result.update("Not matched")
+        result.update("Testing...")
+        rules_snapshot = None if self._compiled_rules is not None else self._tester_rules()
+        self._run_rule_test(test_text, self._compiled_rules, rules_snapshot, self._rules_version)
+
+    @work(thread=True, exclusive=True, group="rule-test")
+    def _run_rule_test(
+        self,
+        test_text: str,
+        compiled: Optional[list[Rule]],
+        rules_snapshot: Optional[list[dict[str, Any]]],
+        version: int,
+    ) -> None:
+        # Compilation and matching run off the UI thread; a newer Test click cancels this one.
+        is_error = False
+        try:
+            if compiled is None:
+                compiled = build_rules(rules_snapshot or [])
+        except re.error as exc:
+            message = f"Invalid regex: {exc}"
+            is_error = True
+        else:
+            message = self._format_test_result(match_rules(test_text, compiled))
+        if get_current_worker().is_cancelled:
             return
-        lines = [f"Matched {len(matches)} rule(s):"]
-        for match in matches:
-            reason = match.reason.replace("\n", "; ")
-            lines.append(f"- {match.rule_name}: {reason}")
-        result.update("\n".join(lines))
+        self.app.call_from_thread(self._finish_rule_test, message, is_error, compiled, version)
+
+    def _finish_rule_test(
+        self,
+        message: str,
+        is_error: bool,
+        compiled: Optional[list[Rule]],
+        version: int,
+    ) -> None:
+        if not is_error and version == self._rules_version:
+            self._compiled_rules = compiled
+        self._regex_error_shown = is_error
+        self._test_result.update(message)
+
+    def _format_test_result(self, matches: list[RuleMatch]) -> str:
+        if not matches:
+            return "Not matched"
+        buffer = io.StringIO()
+        buffer.write(f"Matched {len(matches)} rule(s):")
+        for match in matches[: self.MAX_TEST_MATCHES]:
+            buffer.write("\n- ")
+            buffer.write(match.rule_name)
+            buffer.write(": ")
+            buffer.write(match.reason.replace("\n", "; "))
+        hidden = len(matches) - self.MAX_TEST_MATCHES
+        if hidden > 0:
+            buffer.write(f"\n... and {hidden} more")
+        return buffer.getvalue()
 
     def _set_form_state(self, row_key: Optional[str]) -> None:
         self._loading_form = True
-        name_input = self.query_one("#rule-name", Input)
-        enabled_toggle = self.query_one("#rule-enabled", Switch)
-        keywords_input = self.query_one("#rule-keywords", TextArea)
-        excludes_input = self.query_one("#rule-excludes", TextArea)
-        regex_input = self.query_one("#rule-regex", TextArea)
+        name_input = self._name_input
+        enabled_toggle = self._enabled_toggle
+        keywords_input = self._keywords_input
+        excludes_input = self._excludes_input
+        regex_input = self._regex_input
         if row_key is None:
             name_input.value = ""
             name_input.disabled = True
@@ -290,7 +384,7 @@ class RulesTab(Container):
         self._loading_form = False
 
     def _select_row(self, index: int) -> None:
-        table = self.query_one("#rules-table", DataTable)
+        table = self._table
         row_key = str(index)
         try:
             table.cursor_row = row_key
@@ -301,7 +395,7 @@ class RulesTab(Container):
         self._update_action_state()
 
     def _update_table_cell(self, index: int, column_key: str, value: Any) -> None:
-        table = self.query_one("#rules-table", DataTable)
+        table = self._table
         row_key = str(index)
         try:
             table.get_row(row_key)
@@ -2,12 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import copy
+from functools import partial
+from typing import Any, Callable, Optional
 
-from textual import on
 from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
+from textual.timer import Timer
 from textual.widgets import ContentSwitcher, DataTable, Input, Select, Static, Switch, TextArea
 
+_Handler = Callable[["SettingsTab", Any], None]
+
+
+def _set_choice(*path: str) -> _Handler:
+    def handler(tab: SettingsTab, event: Select.Changed) -> None:
+        tab._set_value(path, event.value)
+
+    return handler
+
+
+def _set_bool(*path: str) -> _Handler:
+    def handler(tab: SettingsTab, event: Switch.Changed) -> None:
+        tab._set_value(path, bool(event.value))
+
+    return handler
+
+
+def _set_str(*path: str) -> _Handler:
+    def handler(tab: SettingsTab, event: Input.Changed) -> None:
+        tab._schedule_update(".".join(path), partial(tab._set_value, path, event.value))
+
+    return handler
+
+
+def _set_int(*path: str) -> _Handler:
+    def handler(tab: SettingsTab, event: Input.Changed) -> None:
+        tab._schedule_update(".".join(path), partial(tab._update_int_value, path, event.value))
+
+    return handler
+
 
 class SettingsTab(Container):
     """Settings tab for editing dedup, notifications, logging, and catch-up."""
@@ -22,12 +54,60 @@ class SettingsTab(Container):
         ("logging", "Logging", "Console/file logging + redaction"),
         ("catch_up", "Catch-up", "Startup backfill scan"),
     ]
+    SECTION_KEYS = [key for key, _, _ in SECTION_LABELS]
+
+    WIDGET_IDS = [
+        "settings-table",
+        "settings-forms",
+        "dedup-mode",
+        "dedup-only-on-match",
+        "dedup-ttl-days",
+        "notifications-method",
+        "notifications-snippet",
+        "notifications-bot",
+        "logging-enabled",
+        "logging-level",
+        "logging-console",
+        "logging-file-enabled",
+        "logging-file-path",
+        "logging-file-max-bytes",
+        "logging-file-backup",
+        "logging-redact-enabled",
+        "logging-redact-patterns",
+        "catchup-enabled",
+        "catchup-messages",
+    ]
+    SECTION_SWITCHER_IDS = {
+        "dedup": "settings-dedup",
+        "notifications": "settings-notifications",
+        "logging": "settings-logging",
+        "catch_up": "settings-catch-up",
+    }
+    ERROR_IDS = {
+        "dedup": "dedup-error",
+        "notifications": "notifications-error",
+        "logging": "logging-error",
+        "catch_up": "catchup-error",
+    }
+
+    # Text inputs commit after typing pauses for this long instead of on every keystroke.
+    DEBOUNCE_SECONDS = 0.2
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._loading_form = False
         self._current_section: Optional[str] = None
         self._table_ready = False
+        self._w: dict[str, Any] = {}
+        self._err: dict[str, Static] = {}
+        self._pending: dict[str, Callable[[], None]] = {}
+        self._debounce_timers: dict[str, Timer] = {}
+        self._committed: dict[str, dict[str, Any]] = {}
+        self._section_cache: dict[str, dict[str, Any]] = {}
+        self._int_cache: dict[str, tuple[str, Optional[int]]] = {}
+        self._err_text: dict[str, str] = {}
+        self._last_redact_text = ""
+        self._last_redact_patterns: list[str] = []
 
     def compose(self):
         with Vertical(id="settings-panel"):
@@ -111,17 +191,33 @@ class SettingsTab(Container):
                             yield Static("", id="catchup-error", classes="settings-error")
 
     def on_mount(self) -> None:
-        table = self.query_one("#settings-table", DataTable)
-        table.add_column("section", key="section", width=18)
-        table.add_column("description", key="description", width=34)
-        for key, label, description in self.SECTION_LABELS:
-            table.add_row(label, description, key=key)
+        self._ensure_widgets()
+        table = self._w["settings-table"]
         table.zebra_stripes = True
+        # Populate inside one batch so the table repaints once, not per column/row.
+        with self.app.batch_update():
+            table.add_column("section", key="section", width=18)
+            table.add_column("description", key="description", width=34)
+            for key, label, description in self.SECTION_LABELS:
+                table.add_row(label, description, key=key)
         self._table_ready = True
         self._select_section("dedup")
         self.reload_from_config()
 
+    def _ensure_widgets(self) -> None:
+        if self._w:
+            return
+        self._w = {widget_id: self.query_one(f"#{widget_id}") for widget_id in self.WIDGET_IDS}
+        self._err = {
+            error_id: self.query_one(f"#{error_id}", Static) for error_id in self.ERROR_IDS.values()
+        }
+
     def reload_from_config(self) -> None:
+        self._ensure_widgets()
+        self._cancel_pending_updates()
+        self._section_cache = {key: dict(self._get_section(key)) for key in self.SECTION_KEYS}
+        self._committed = copy.deepcopy(self._section_cache)
+        self._int_cache.clear()
         self._loading_form = True
         self._load_dedup()
         self._load_notifications()
@@ -135,14 +231,43 @@ class SettingsTab(Container):
 
     def _select_section(self, section_id: str) -> None:
         self._current_section = section_id
-        switcher = self.query_one("#settings-forms", ContentSwitcher)
-        switcher.current = f"settings-{section_id.replace('_', '-')}"
-        table = self.query_one("#settings-table", DataTable)
+        switcher = self._w["settings-forms"]
+        switcher.current = self.SECTION_SWITCHER_IDS[section_id]
+        table = self._w["settings-table"]
         try:
             table.cursor_row = section_id
         except Exception:
             pass
 
+    def flush_pending_updates(self) -> None:
+        """Commit debounced edits immediately (e.g. before saving)."""
+        for key in list(self._pending):
+            self._run_pending_update(key)
+
+    def _schedule_update(self, key: str, callback: Callable[[], None]) -> None:
+        timer = self._debounce_timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+        self._pending[key] = callback
+        self._debounce_timers[key] = self.set_timer(
+            self.DEBOUNCE_SECONDS,
+            partial(self._run_pending_update, key),
+        )
+
+    def _run_pending_update(self, key: str) -> None:
+        timer = self._debounce_timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+        callback = self._pending.pop(key, None)
+        if callback is not None:
+            callback()
+
+    def _cancel_pending_updates(self) -> None:
+        for timer in self._debounce_timers.values():
+            timer.stop()
+        self._debounce_timers.clear()
+        self._pending.clear()
+
     def _get_section(self, key: str) -> dict[str, Any]:
         data = self.app.config_state.data or {}
         section = data.get(key)
@@ -150,7 +275,19 @@ class SettingsTab(Container):
             return section
         return {}
 
+    def _get_cached(self, key: str) -> dict[str, Any]:
+        # Working copy reused across edits; rebuilt whenever the config is (re)loaded.
+        section = self._section_cache.get(key)
+        if section is None:
+            section = self._section_cache[key] = dict(self._get_section(key))
+        return section
+
     def _update_section(self, key: str, section: dict[str, Any]) -> None:
+        # Handlers edit the live section in place, so compare against the last committed
+        # snapshot; unchanged values (e.g. Switch bounces) never mark the config dirty.
+        if self._committed.get(key) == section:
+            return
+        self._committed[key] = copy.deepcopy(section)
         self.app.update_config_section(key, section)
 
     def _load_dedup(self) -> None:
@@ -158,10 +295,10 @@ class SettingsTab(Container):
         mode = dedup.get("mode", "per_source")
         only_on_match = bool(dedup.get("only_on_match", True))
         ttl_days = dedup.get("ttl_days", 30)
-        self._set_select_value("#dedup-mode", mode, self.DEDUP_MODES, "dedup-error")
-        self.query_one("#dedup-only-on-match", Switch).value = only_on_match
-        self.query_one("#dedup-ttl-days", Input).value = str(ttl_days)
-        self._set_error("dedup-error", "")
+        self._set_select_value("dedup-mode", mode, self.DEDUP_MODES, self.ERROR_IDS["dedup"])
+        self._w["dedup-only-on-match"].value = only_on_match
+        self._w["dedup-ttl-days"].value = str(ttl_days)
+        self._set_error(self.ERROR_IDS["dedup"], "")
 
     def _load_notifications(self) -> None:
         notifications = self._get_section("notifications")
@@ -169,15 +306,15 @@ class SettingsTab(Container):
         snippet_chars = notifications.get("snippet_chars", 400)
         bot_chat_id = notifications.get("bot_chat_id")
         self._set_select_value(
-            "#notifications-method",
+            "notifications-method",
             method,
             self.NOTIFICATION_METHODS,
-            "notifications-error",
+            self.ERROR_IDS["notifications"],
         )
-        self.query_one("#notifications-snippet", Input).value = str(snippet_chars)
-        self.query_one("#notifications-bot", Input).value = "" if bot_chat_id is None else str(bot_chat_id)
+        self._w["notifications-snippet"].value = str(snippet_chars)
+        self._w["notifications-bot"].value = "" if bot_chat_id is None else str(bot_chat_id)
         self._apply_notifications_state(method)
-        self._set_error("notifications-error", "")
+        self._set_error(self.ERROR_IDS["notifications"], "")
 
     def _load_logging(self) -> None:
         logging = self._get_section("logging")
@@ -193,28 +330,30 @@ class SettingsTab(Container):
         redact_enabled = bool(redact_cfg.get("enabled", False))
         patterns = redact_cfg.get("patterns", []) or []
 
-        self.query_one("#logging-enabled", Switch).value = enabled
-        self._set_select_value("#logging-level", level, self.LOG_LEVELS, "logging-error")
-        self.query_one("#logging-console", Switch).value = console
-        self.query_one("#logging-file-enabled", Switch).value = file_enabled
-        self.query_one("#logging-file-path", Input).value = str(file_path)
-        self.query_one("#logging-file-max-bytes", Input).value = str(file_max)
-        self.query_one("#logging-file-backup", Input).value = str(file_backup)
-        self.query_one("#logging-redact-enabled", Switch).value = redact_enabled
-        self.query_one("#logging-redact-patterns", TextArea).text = "\n".join(patterns)
+        self._w["logging-enabled"].value = enabled
+        self._set_select_value("logging-level", level, self.LOG_LEVELS, self.ERROR_IDS["logging"])
+        self._w["logging-console"].value = console
+        self._w["logging-file-enabled"].value = file_enabled
+        self._w["logging-file-path"].value = str(file_path)
+        self._w["logging-file-max-bytes"].value = str(file_max)
+        self._w["logging-file-backup"].value = str(file_backup)
+        self._w["logging-redact-enabled"].value = redact_enabled
+        self._last_redact_text = "\n".join(patterns)
+        self._last_redact_patterns = list(patterns)
+        self._w["logging-redact-patterns"].text = self._last_redact_text
         self._apply_logging_state(file_enabled, redact_enabled)
-        self._set_error("logging-error", "")
+        self._set_error(self.ERROR_IDS["logging"], "")
 
     def _load_catch_up(self) -> None:
         catch_up = self._get_section("catch_up")
         enabled = bool(catch_up.get("enabled", False))
         messages = catch_up.get("messages_per_source", 50)
-        self.query_one("#catchup-enabled", Switch).value = enabled
-        self.query_one("#catchup-messages", Input).value = str(messages)
-        self._set_error("catchup-error", "")
+        self._w["catchup-enabled"].value = enabled
+        self._w["catchup-messages"].value = str(messages)
+        self._set_error(self.ERROR_IDS["catch_up"], "")
 
-    def _set_select_value(self, selector: str, value: str, allowed: list[str], error_id: str) -> None:
-        select = self.query_one(selector, Select)
+    def _set_select_value(self, widget_id: str, value: str, allowed: list[str], error_id: str) -> None:
+        select = self._w[widget_id]
         if value in allowed:
             select.value = value
             self._set_error(error_id, "")
@@ -223,198 +362,146 @@ class SettingsTab(Container):
             self._set_error(error_id, f"Invalid value: {value}")
 
     def _set_error(self, error_id: str, message: str) -> None:
-        self.query_one(f"#{error_id}", Static).update(message)
+        # Static.update queues a repaint; skip it when the label already shows this text.
+        if self._err_text.get(error_id) == message:
+            return
+        self._err_text[error_id] = message
+        self._err[error_id].update(message)
 
     def _apply_notifications_state(self, method: str) -> None:
-        bot_input = self.query_one("#notifications-bot", Input)
-        bot_input.disabled = method != "bot"
+        self._set_disabled("notifications-bot", method != "bot")
 
     def _apply_logging_state(self, file_enabled: bool, redact_enabled: bool) -> None:
-        self.query_one("#logging-file-path", Input).disabled = not file_enabled
-        self.query_one("#logging-file-max-bytes", Input).disabled = not file_enabled
-        self.query_one("#logging-file-backup", Input).disabled = not file_enabled
-        self.query_one("#logging-redact-patterns", TextArea).disabled = not redact_enabled
-
-    @on(Select.Changed, "#dedup-mode")
-    def _on_dedup_mode_changed(self, event: Select.Changed) -> None:
-        if self._loading_form or event.value is Select.BLANK:
+        self._set_disabled("logging-file-path", not file_enabled)
+        self._set_disabled("logging-file-max-bytes", not file_enabled)
+        self._set_disabled("logging-file-backup", not file_enabled)
+        self._set_disabled("logging-redact-patterns", not redact_enabled)
+
+    def _set_disabled(self, widget_id: str, disabled: bool) -> None:
+        # Assigning .disabled restyles the widget even when the value is unchanged.
+        widget = self._w[widget_id]
+        if widget.disabled != disabled:
+            widget.disabled = disabled
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.value is Select.BLANK:
             return
-        dedup = self._get_section("dedup")
-        dedup["mode"] = event.value
-        self._update_section("dedup", dedup)
+        self._dispatch(event)
 
-    @on(Switch.Changed, "#dedup-only-on-match")
-    def _on_dedup_only_on_match(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        dedup = self._get_section("dedup")
-        dedup["only_on_match"] = bool(event.value)
-        self._update_section("dedup", dedup)
+    def on_switch_changed(self, event: Switch.Changed) -> None:
+        self._dispatch(event)
 
-    @on(Input.Changed, "#dedup-ttl-days")
-    def _on_dedup_ttl_changed(self, event: Input.Changed) -> None:
+    def on_input_changed(self, event: Input.Changed) -> None:
+        self._dispatch(event)
+
+    def on_text_area_changed(self, event: TextArea.Changed) -> None:
+        self._dispatch(event)
+
+    def _dispatch(self, event: Any) -> None:
         if self._loading_form:
             return
-        self._update_int_field("dedup", "ttl_days", event.value, "dedup-error")
+        handler = self._DISPATCH.get(event.control.id or "")
+        if handler is not None:
+            handler(self, event)
+
+    def _set_value(self, path: tuple[str, ...], value: Any) -> None:
+        section = self._get_cached(path[0])
+        target = section
+        for key in path[1:-1]:
+            target = self._ensure_subdict(target, key)
+        target[path[-1]] = value
+        self._update_section(path[0], section)
+
+    def _update_int_value(self, path: tuple[str, ...], value: str) -> None:
+        parsed = self._parse_int(value, self.ERROR_IDS[path[0]])
+        if parsed is None:
+            return
+        self._set_value(path, parsed)
 
-    @on(Select.Changed, "#notifications-method")
     def _on_notifications_method(self, event: Select.Changed) -> None:
-        if self._loading_form or event.value is Select.BLANK:
-            return
-        notifications = self._get_section("notifications")
-        notifications["notification_method"] = event.value
-        self._update_section("notifications", notifications)
+        self._set_value(("notifications", "notification_method"), event.value)
         self._apply_notifications_state(event.value)
 
-    @on(Input.Changed, "#notifications-snippet")
-    def _on_notifications_snippet(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        self._update_int_field("notifications", "snippet_chars", event.value, "notifications-error")
-
-    @on(Input.Changed, "#notifications-bot")
     def _on_notifications_bot(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        notifications = self._get_section("notifications")
-        value = event.value.strip()
+        self._schedule_update(
+            "notifications.bot_chat_id",
+            partial(self._commit_notifications_bot, event.value),
+        )
+
+    def _commit_notifications_bot(self, raw_value: str) -> None:
+        notifications = self._get_cached("notifications")
+        value = raw_value.strip()
         if value:
             notifications["bot_chat_id"] = value
         else:
             notifications.pop("bot_chat_id", None)
         self._update_section("notifications", notifications)
 
-    @on(Switch.Changed, "#catchup-enabled")
-    def _on_catchup_enabled(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        catch_up = self._get_section("catch_up")
-        catch_up["enabled"] = bool(event.value)
-        self._update_section("catch_up", catch_up)
-
-    @on(Input.Changed, "#catchup-messages")
-    def _on_catchup_messages(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        self._update_int_field("catch_up", "messages_per_source", event.value, "catchup-error")
-
-    @on(Switch.Changed, "#logging-enabled")
-    def _on_logging_enabled(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        logging = self._get_section("logging")
-        logging["enabled"] = bool(event.value)
-        self._update_section("logging", logging)
-
-    @on(Select.Changed, "#logging-level")
-    def _on_logging_level(self, event: Select.Changed) -> None:
-        if self._loading_form or event.value is Select.BLANK:
-            return
-        logging = self._get_section("logging")
-        logging["level"] = event.value
-        self._update_section("logging", logging)
-
-    @on(Switch.Changed, "#logging-console")
-    def _on_logging_console(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        logging = self._get_section("logging")
-        logging["console"] = bool(event.value)
-        self._update_section("logging", logging)
-
-    @on(Switch.Changed, "#logging-file-enabled")
     def _on_logging_file_enabled(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        logging = self._get_section("logging")
-        file_cfg = self._get_subdict(logging, "file")
-        file_cfg["enabled"] = bool(event.value)
-        logging["file"] = file_cfg
-        self._update_section("logging", logging)
-        redact_enabled = bool(self._get_subdict(logging, "redact").get("enabled", False))
-        self._apply_logging_state(bool(event.value), redact_enabled)
-
-    @on(Input.Changed, "#logging-file-path")
-    def _on_logging_file_path(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        logging = self._get_section("logging")
-        file_cfg = self._get_subdict(logging, "file")
-        file_cfg["path"] = event.value
-        logging["file"] = file_cfg
-        self._update_section("logging", logging)
+        self._set_value(("logging", "file", "enabled"), bool(event.value))
+        self._refresh_logging_state()
 
-    @on(Input.Changed, "#logging-file-max-bytes")
-    def _on_logging_file_max(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        self._update_nested_int_field(
-            "logging",
-            ("file", "max_bytes"),
-            event.value,
-            "logging-error",
-        )
-
-    @on(Input.Changed, "#logging-file-backup")
-    def _on_logging_file_backup(self, event: Input.Changed) -> None:
-        if self._loading_form:
-            return
-        self._update_nested_int_field(
-            "logging",
-            ("file", "backup_count"),
-            event.value,
-            "logging-error",
-        )
-
-    @on(Switch.Changed, "#logging-redact-enabled")
     def _on_logging_redact_enabled(self, event: Switch.Changed) -> None:
-        if self._loading_form:
-            return
-        logging = self._get_section("logging")
-        redact_cfg = self._get_subdict(logging, "redact")
-        redact_cfg["enabled"] = bool(event.value)
-        logging["redact"] = redact_cfg
-        self._update_section("logging", logging)
+        self._set_value(("logging", "redact", "enabled"), bool(event.value))
+        self._refresh_logging_state()
+
+    def _refresh_logging_state(self) -> None:
+        logging = self._get_cached("logging")
         file_enabled = bool(self._get_subdict(logging, "file").get("enabled", False))
-        self._apply_logging_state(file_enabled, bool(event.value))
+        redact_enabled = bool(self._get_subdict(logging, "redact").get("enabled", False))
+        self._apply_logging_state(file_enabled, redact_enabled)
 
-    @on(TextArea.Changed, "#logging-redact-patterns")
     def _on_logging_redact_patterns(self, event: TextArea.Changed) -> None:
-        if self._loading_form:
+        # Programmatic loads post TextArea.Changed too; ignore buffers already seen.
+        text = event.text_area.text
+        if text == self._last_redact_text:
             return
-        logging = self._get_section("logging")
-        redact_cfg = self._get_subdict(logging, "redact")
-        patterns = [line.strip() for line in event.text_area.text.splitlines() if line.strip()]
-        redact_cfg["patterns"] = patterns
-        logging["redact"] = redact_cfg
-        self._update_section("logging", logging)
+        self._last_redact_text = text
+        self._schedule_update(
+            "logging.redact.patterns",
+            partial(self._commit_logging_redact_patterns, text),
+        )
 
-    def _update_int_field(self, section: str, key: str, value: str, error_id: str) -> None:
-        parsed = self._parse_int(value, error_id)
-        if parsed is None:
+    def _commit_logging_redact_patterns(self, text: str) -> None:
+        patterns = [line.strip() for line in text.splitlines() if line.strip()]
+        # Whitespace-only or blank-line edits parse to the same list; nothing to write.
+        if patterns == self._last_redact_patterns:
             return
-        config = self._get_section(section)
-        config[key] = parsed
-        self._update_section(section, config)
-
-    def _update_nested_int_field(
-        self,
-        section: str,
-        path: tuple[str, str],
-        value: str,
-        error_id: str,
-    ) -> None:
-        parsed = self._parse_int(value, error_id)
-        if parsed is None:
-            return
-        config = self._get_section(section)
-        nested = self._get_subdict(config, path[0])
-        nested[path[1]] = parsed
-        config[path[0]] = nested
-        self._update_section(section, config)
+        self._last_redact_patterns = patterns
+        self._set_value(("logging", "redact", "patterns"), patterns)
+
+    # One table routes every form control; ids are unique across widget types.
+    _DISPATCH: dict[str, _Handler] = {
+        "dedup-mode": _set_choice("dedup", "mode"),
+        "dedup-only-on-match": _set_bool("dedup", "only_on_match"),
+        "dedup-ttl-days": _set_int("dedup", "ttl_days"),
+        "notifications-method": _on_notifications_method,
+        "notifications-snippet": _set_int("notifications", "snippet_chars"),
+        "notifications-bot": _on_notifications_bot,
+        "logging-enabled": _set_bool("logging", "enabled"),
+        "logging-level": _set_choice("logging", "level"),
+        "logging-console": _set_bool("logging", "console"),
+        "logging-file-enabled": _on_logging_file_enabled,
+        "logging-file-path": _set_str("logging", "file", "path"),
+        "logging-file-max-bytes": _set_int("logging", "file", "max_bytes"),
+        "logging-file-backup": _set_int("logging", "file", "backup_count"),
+        "logging-redact-enabled": _on_logging_redact_enabled,
+        "logging-redact-patterns": _on_logging_redact_patterns,
+        "catchup-enabled": _set_bool("catch_up", "enabled"),
+        "catchup-messages": _set_int("catch_up", "messages_per_source"),
+    }
 
     def _parse_int(self, value: str, error_id: str) -> Optional[int]:
         stripped = value.strip()
+        cached = self._int_cache.get(error_id)
+        if cached is not None and cached[0] == stripped:
+            # Same text as the last parse: the error label already reflects it.
+            return cached[1]
+        parsed = self._parse_int_text(stripped, error_id)
+        self._int_cache[error_id] = (stripped, parsed)
+        return parsed
+
+    def _parse_int_text(self, stripped: str, error_id: str) -> Optional[int]:
         if not stripped:
             self._set_error(error_id, "")
             return None
@@ -430,6 +517,14 @@ class SettingsTab(Container):
             return str(value.value)
         return str(value)
 
+    @staticmethod
+    def _ensure_subdict(parent: dict[str, Any], key: str) -> dict[str, Any]:
+        # Edit nested sections in place; a missing or malformed value is replaced once.
+        value = parent.get(key)
+        if not isinstance(value, dict):
+            value = parent[key] = {}
+        return value
+
     @staticmethod
     def _get_subdict(parent: dict[str, Any], key: str) -> dict[str, Any]:
         value = parent.get(key)
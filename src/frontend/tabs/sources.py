@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Optional
+from typing import Any, Optional
+from uuid import uuid4
 
 from textual import on
 from textual.containers import Container, Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Input, Static, Switch
 
 from ..modals import AddSourceScreen, DeleteSourceScreen
@@ -15,11 +17,22 @@ from ..validators import SourceKeyInfo, parse_source_key
 class SourcesTab(Container):
     """Sources tab for editing config.sources."""
 
+    # Alias edits commit after typing pauses for this long instead of on every keystroke.
+    DEBOUNCE_SECONDS = 0.2
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._loading_form = False
         self._current_row_key: Optional[str] = None
         self._table_ready = False
+        self._alias_timer: Optional[Timer] = None
+        self._pending_alias: Optional[tuple[int, str]] = None
+        self._source_key_error = ""
+        # Table row keys, parallel to config.sources; kept out of the saved config.
+        self._row_ids: list[str] = []
+        self._row_index: dict[str, int] = {}
+        # Parsed source_key per row, refreshed on reload and on source_key edits.
+        self._row_infos: list[SourceKeyInfo] = []
 
     def compose(self):
         with Vertical(id="sources-panel"):
@@ -44,7 +57,15 @@ class SourcesTab(Container):
                 yield Button("Delete", id="delete-source", variant="error")
 
     def on_mount(self) -> None:
-        table = self.query_one("#sources-table", DataTable)
+        self._table = self.query_one("#sources-table", DataTable)
+        self._key_input = self.query_one("#source-key-input", Input)
+        self._key_error = self.query_one("#source-key-error", Static)
+        self._alias_input = self.query_one("#alias-input", Input)
+        self._enabled_toggle = self.query_one("#enabled-toggle", Switch)
+        self._type_display = self.query_one("#source-type", Static)
+        self._topic_display = self.query_one("#source-topic", Static)
+        self._delete_btn = self.query_one("#delete-source", Button)
+        table = self._table
         table.add_column("enabled", key="enabled", width=8)
         table.add_column("source_key", key="source_key", width=32)
         table.add_column("alias", key="alias", width=20)
@@ -58,28 +79,38 @@ class SourcesTab(Container):
     def reload_from_config(self) -> None:
         if not self._table_ready:
             return
-        table = self.query_one("#sources-table", DataTable)
-        table.clear()
-        for index, source, info in self._iter_sources():
-            enabled_label = "yes" if source.get("enabled", True) else "no"
-            alias = source.get("alias", "")
-            topic_label = f"#topic:{info.topic_id}" if info.topic_id else ""
-            row_key = str(index)
-            table.add_row(
-                enabled_label,
-                source.get("source_key", ""),
-                alias,
-                info.kind,
-                topic_label,
-                key=row_key,
-            )
+        self._cancel_pending_alias()
+        table = self._table
+        sources = self._get_sources()
+        self._row_infos = [parse_source_key(str(source.get("source_key", ""))) for source in sources]
+        rows = [self._row_cells(source, info) for source, info in zip(sources, self._row_infos)]
+        # Reuse existing keys positionally so the current selection survives a reload.
+        row_ids = self._row_ids[: len(rows)]
+        row_ids.extend(uuid4().hex for _ in range(len(rows) - len(row_ids)))
+        self._row_ids = row_ids
+        self._reindex_rows()
+        with self.app.batch_update():
+            table.clear()
+            for row_key, cells in zip(row_ids, rows):
+                table.add_row(*cells, key=row_key)
         self._update_action_state()
 
-    def _iter_sources(self) -> Iterable[tuple[int, dict[str, Any], SourceKeyInfo]]:
-        sources = self._get_sources()
-        for index, source in enumerate(sources):
-            info = parse_source_key(str(source.get("source_key", "")))
-            yield index, source, info
+    def _reindex_rows(self, start: int = 0) -> None:
+        row_index = self._row_index
+        if start == 0:
+            row_index.clear()
+        for index in range(start, len(self._row_ids)):
+            row_index[self._row_ids[index]] = index
+
+    @staticmethod
+    def _row_cells(source: dict[str, Any], info: SourceKeyInfo) -> tuple[str, ...]:
+        return (
+            "yes" if source.get("enabled", True) else "no",
+            source.get("source_key", ""),
+            source.get("alias", ""),
+            info.kind,
+            f"#topic:{info.topic_id}" if info.topic_id else "",
+        )
 
     def _get_sources(self) -> list[dict[str, Any]]:
         data = self.app.config_state.data or {}
@@ -92,10 +123,10 @@ class SourcesTab(Container):
         self.app.update_config_section("sources", sources)
 
     def _update_action_state(self) -> None:
-        delete_btn = self.query_one("#delete-source", Button)
-        delete_btn.disabled = self._current_row_key is None
+        self._delete_btn.disabled = self._current_row_key is None
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        self.flush_pending_updates()
         self._current_row_key = self._coerce_row_key(event.row_key)
         self._set_form_state(self._current_row_key)
         self._update_action_state()
@@ -110,7 +141,30 @@ class SourcesTab(Container):
         sources = self._get_sources()
         if index >= len(sources):
             return
-        alias = event.value.strip()
+        self._pending_alias = (index, event.value)
+        if self._alias_timer is not None:
+            self._alias_timer.stop()
+        self._alias_timer = self.set_timer(self.DEBOUNCE_SECONDS, self._commit_alias)
+
+    def flush_pending_updates(self) -> None:
+        """Commit a debounced alias edit immediately (before save, reload or quit)."""
+        self._commit_alias()
+
+    def _commit_alias(self) -> None:
+        if self._alias_timer is not None:
+            self._alias_timer.stop()
+            self._alias_timer = None
+        pending = self._pending_alias
+        self._pending_alias = None
+        if pending is None:
+            return
+        index, value = pending
+        sources = self._get_sources()
+        if index >= len(sources):
+            return
+        alias = value.strip()
+        if sources[index].get("alias", "") == alias:
+            return
         if alias:
             sources[index]["alias"] = alias
         else:
@@ -122,8 +176,15 @@ class SourcesTab(Container):
     def _on_source_key_changed(self) -> None:
         if self._loading_form:
             return
+        # Only clears a previous validation error; a no-op while the label is empty.
         self._set_source_key_error("")
 
+    def _cancel_pending_alias(self) -> None:
+        if self._alias_timer is not None:
+            self._alias_timer.stop()
+            self._alias_timer = None
+        self._pending_alias = None
+
     @on(Input.Submitted, "#source-key-input")
     def _on_source_key_submitted(self, event: Input.Submitted) -> None:
         if self._loading_form:
@@ -140,6 +201,7 @@ class SourcesTab(Container):
             return
         sources[index]["source_key"] = info.normalized
         self._set_sources(sources)
+        self._row_infos[index] = info
         self._update_table_cell(index, "source_key", info.normalized)
         self._update_table_cell(index, "type", info.kind)
         topic_label = f"#topic:{info.topic_id}" if info.topic_id else ""
@@ -147,8 +209,8 @@ class SourcesTab(Container):
         self._loading_form = True
         event.input.value = info.normalized
         self._loading_form = False
-        self.query_one("#source-type", Static).update(info.kind)
-        self.query_one("#source-topic", Static).update(topic_label)
+        self._type_display.update(info.kind)
+        self._topic_display.update(topic_label)
 
     @on(Switch.Changed, "#enabled-toggle")
     def _on_enabled_changed(self, event: Switch.Changed) -> None:
@@ -160,9 +222,12 @@ class SourcesTab(Container):
         sources = self._get_sources()
         if index >= len(sources):
             return
-        sources[index]["enabled"] = bool(event.value)
+        enabled = bool(event.value)
+        if bool(sources[index].get("enabled", True)) == enabled:
+            return
+        sources[index]["enabled"] = enabled
         self._set_sources(sources)
-        self._update_table_cell(index, "enabled", "yes" if event.value else "no")
+        self._update_table_cell(index, "enabled", "yes" if enabled else "no")
 
     @on(Button.Pressed, "#add-source")
     def _on_add_source(self) -> None:
@@ -182,14 +247,22 @@ class SourcesTab(Container):
     def _handle_add_source(self, payload: dict[str, Any] | None) -> None:
         if not payload:
             return
+        self.flush_pending_updates()
         sources = self._get_sources()
         sources.append(payload)
         self._set_sources(sources)
-        self.reload_from_config()
+        info = parse_source_key(str(payload.get("source_key", "")))
+        row_key = uuid4().hex
+        self._row_ids.append(row_key)
+        self._row_infos.append(info)
+        self._row_index[row_key] = len(self._row_ids) - 1
+        self._table.add_row(*self._row_cells(payload, info), key=row_key)
+        self._update_action_state()
 
     def _handle_delete_source(self, confirmed: bool | None) -> None:
         if not confirmed:
             return
+        self.flush_pending_updates()
         index = self._current_index()
         if index is None:
             return
@@ -198,27 +271,28 @@ class SourcesTab(Container):
             return
         sources.pop(index)
         self._set_sources(sources)
+        row_key = self._row_ids.pop(index)
+        del self._row_infos[index]
+        del self._row_index[row_key]
+        self._reindex_rows(index)
         self._current_row_key = None
-        self.reload_from_config()
+        self._table.remove_row(row_key)
+        self._update_action_state()
         self._set_form_state(None)
 
     def _update_table_cell(self, index: int, column_key: str, value: Any) -> None:
-        table = self.query_one("#sources-table", DataTable)
-        row_key = str(index)
-        try:
-            table.get_row(row_key)
-        except Exception:
+        if index >= len(self._row_ids):
             self.reload_from_config()
             return
-        table.update_cell(row_key, column_key, value)
+        self._table.update_cell(self._row_ids[index], column_key, value)
 
     def _set_form_state(self, row_key: Optional[str]) -> None:
         self._loading_form = True
-        alias_input = self.query_one("#alias-input", Input)
-        enabled_toggle = self.query_one("#enabled-toggle", Switch)
-        key_input = self.query_one("#source-key-input", Input)
-        type_display = self.query_one("#source-type", Static)
-        topic_display = self.query_one("#source-topic", Static)
+        alias_input = self._alias_input
+        enabled_toggle = self._enabled_toggle
+        key_input = self._key_input
+        type_display = self._type_display
+        topic_display = self._topic_display
         self._set_source_key_error("")
         if row_key is None:
             alias_input.value = ""
@@ -230,9 +304,9 @@ class SourcesTab(Container):
             type_display.update("")
             topic_display.update("")
         else:
-            index = int(row_key)
+            index = self._row_index.get(row_key)
             sources = self._get_sources()
-            if index >= len(sources):
+            if index is None or index >= len(sources) or index >= len(self._row_infos):
                 self._loading_form = False
                 return
             source = sources[index]
@@ -240,10 +314,9 @@ class SourcesTab(Container):
             alias_input.disabled = False
             enabled_toggle.value = bool(source.get("enabled", True))
             enabled_toggle.disabled = False
-            key_value = str(source.get("source_key", ""))
-            key_input.value = key_value
+            key_input.value = str(source.get("source_key", ""))
             key_input.disabled = False
-            info = parse_source_key(key_value)
+            info = self._row_infos[index]
             type_display.update(info.kind)
             topic_display.update(f"#topic:{info.topic_id}" if info.topic_id else "")
         self._loading_form = False
@@ -251,10 +324,7 @@ class SourcesTab(Container):
     def _current_index(self) -> Optional[int]:
         if self._current_row_key is None:
             return None
-        try:
-            return int(self._current_row_key)
-        except ValueError:
-            return None
+        return self._row_index.get(self._current_row_key)
 
     @staticmethod
     def _coerce_row_key(value: Any) -> str:
@@ -263,5 +333,7 @@ class SourcesTab(Container):
         return str(value)
 
     def _set_source_key_error(self, message: str) -> None:
-        error = self.query_one("#source-key-error", Static)
-        error.update(message)
+        if message == self._source_key_error:
+            return
+        self._source_key_error = message
+        self._key_error.update(message)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
+# Telegram usernames are ASCII letters, digits and underscores.
+_USERNAME_RE = re.compile(r"[A-Za-z0-9_]+")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SourceKeyInfo:
     normalized: str | None
     kind: str
@@ -13,21 +18,24 @@ class SourceKeyInfo:
     error: str | None = None
 
 
+@lru_cache(maxsize=512)
 def parse_source_key(raw_value: str) -> SourceKeyInfo:
     raw_value = raw_value.strip()
     if not raw_value:
         return SourceKeyInfo(None, "invalid", None, "source_key is required")
 
-    base, sep, topic = raw_value.partition("#topic:")
+    base = raw_value
     topic_id: str | None = None
-    if sep:
-        if not topic.isdigit():
-            return SourceKeyInfo(None, "invalid", None, "topic id must be numeric")
-        topic_id = topic
+    if "#" in raw_value:
+        base, sep, topic = raw_value.partition("#topic:")
+        if sep:
+            if not topic.isdigit():
+                return SourceKeyInfo(None, "invalid", None, "topic id must be numeric")
+            topic_id = topic
 
     if base.startswith("@"):
         username = base[1:]
-        if not username or not username.replace("_", "a").isalnum():
+        if _USERNAME_RE.fullmatch(username) is None:
             return SourceKeyInfo(None, "invalid", topic_id, "username is invalid")
         normalized = f"@{username.lower()}"
         if topic_id:
@@ -35,10 +43,10 @@ def parse_source_key(raw_value: str) -> SourceKeyInfo:
         return SourceKeyInfo(normalized, "username", topic_id)
 
     if base.startswith("chat_id:"):
-        chat_value = base[len("chat_id:") :]
-        if not chat_value or not _is_int(chat_value):
+        chat_value = _canonical_int(base[len("chat_id:") :])
+        if chat_value is None:
             return SourceKeyInfo(None, "invalid", topic_id, "chat_id must be numeric")
-        normalized = f"chat_id:{int(chat_value)}"
+        normalized = f"chat_id:{chat_value}"
         if topic_id:
             normalized = f"{normalized}#topic:{topic_id}"
         return SourceKeyInfo(normalized, "chat_id", topic_id)
@@ -46,9 +54,19 @@ def parse_source_key(raw_value: str) -> SourceKeyInfo:
     return SourceKeyInfo(None, "invalid", None, "source_key must start with @ or chat_id:")
 
 
-def _is_int(value: str) -> bool:
-    try:
-        int(value)
-    except ValueError:
-        return False
-    return True
+def _canonical_int(value: str) -> str | None:
+    """Canonicalize an optionally negative run of ASCII digits, else return None.
+
+    Stricter than int(): signs other than a leading "-", underscores, whitespace
+    and non-ASCII digits are rejected. Accepted values canonicalize exactly as
+    str(int(value)) would, so they agree with core.source_keys.
+    """
+
+    negative = value.startswith("-")
+    digits = value[1:] if negative else value
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    digits = digits.lstrip("0") or "0"
+    if negative and digits != "0":
+        return f"-{digits}"
+    return digits
@@ -7,6 +7,11 @@ single JSON file for quick edits without touching Python.
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from core.source_keys import expand_source_key_variants
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -25,11 +30,15 @@ def _load_json_config() -> dict:
     if not os.path.exists(CONFIG_PATH):
         raise FileNotFoundError(f"Config file not found: {CONFIG_PATH}")
 
+    if orjson is not None:
+        # orjson parses UTF-8 bytes directly; its decode error subclasses json's.
+        with open(CONFIG_PATH, "rb") as handle:
+            return orjson.loads(handle.read())
     with open(CONFIG_PATH, "r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
-def _normalize_sources(raw_sources: list[dict]) -> tuple[set[str], dict[str, str]]:
+def _normalize_sources(raw_sources: list[dict]) -> tuple[frozenset[str], dict[str, str]]:
     """Normalize sources and build an alias map keyed by source_key."""
 
     sources: set[str] = set()
@@ -51,7 +60,7 @@ def _normalize_sources(raw_sources: list[dict]) -> tuple[set[str], dict[str, str
                 if key == source_key:
                     continue
                 aliases.setdefault(key, alias)
-    return sources, aliases
+    return frozenset(sources), aliases
 
 
 _CONFIG = _load_json_config()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Optional
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -9,3 +11,86 @@ SRC = ROOT / "src"
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+from core.config import DedupConfig  # noqa: E402
+from core.models import MatchRecord, MessageContext  # noqa: E402
+from core.processor import MessageProcessor  # noqa: E402
+from core.rules_engine import build_rules  # noqa: E402
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.last_ids: dict[str, int] = {}
+        self.saved: list[tuple[MessageContext, MatchRecord]] = []
+        self.seen: set[str] = set()
+
+    def get_last_id(self, source_key: str) -> Optional[int]:
+        return self.last_ids.get(source_key)
+
+    def set_last_id(self, source_key: str, last_message_id: int) -> None:
+        self.last_ids[source_key] = last_message_id
+
+    def is_seen(self, fingerprint: str) -> bool:
+        return fingerprint in self.seen
+
+    def mark_seen(self, fingerprint: str) -> None:
+        self.seen.add(fingerprint)
+
+    def try_mark_seen(self, fingerprint: str) -> bool:
+        if fingerprint in self.seen:
+            return False
+        self.seen.add(fingerprint)
+        return True
+
+    def save_match(self, context: MessageContext, match: MatchRecord) -> None:
+        self.saved.append((context, match))
+
+    def save_matches(self, context: MessageContext, matches: list[MatchRecord]) -> None:
+        self.saved.extend((context, match) for match in matches)
+
+
+class FakeNotifier:
+    def __init__(self) -> None:
+        self.sent: list[tuple[MessageContext, str]] = []
+
+    async def send(self, context: MessageContext, match, snippet: str) -> None:
+        self.sent.append((context, snippet))
+
+
+def _make_context(
+    *,
+    source_key: str = "@group",
+    base_source_key: str = "@group",
+    topic_id: Optional[int] = None,
+    message_id: int,
+) -> MessageContext:
+    return MessageContext(
+        source_key=source_key,
+        base_source_key=base_source_key,
+        topic_id=topic_id,
+        chat_id=123,
+        message_id=message_id,
+        date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        text="hello world",
+        permalink=None,
+        topic_permalink=None,
+    )
+
+
+def _make_processor(
+    storage: FakeStorage,
+    notifier: Any,
+    *,
+    rules: Optional[list[dict[str, Any]]] = None,
+    dedup_config: Optional[DedupConfig] = None,
+    **kwargs: Any,
+) -> MessageProcessor:
+    return MessageProcessor(
+        rules=build_rules(rules or [{"name": "greet", "keywords": ["hello"], "enabled": True}]),
+        storage=storage,
+        notifier=notifier,
+        allowed_sources={"@group"},
+        dedup_config=dedup_config or DedupConfig(mode="off", only_on_match=True, ttl_days=30),
+        snippet_chars=100,
+        **kwargs,
+    )
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from core import dedup
+from core.dedup import (
+    compute_fingerprint,
+    normalize_for_fingerprint,
+    normalize_lowered_for_fingerprint,
+)
+
+
+def test_normalize_collapses_unicode_whitespace() -> None:
+    text = "  Hello\t\u00a0WORLD\n foo bar \r\n"
+    assert normalize_for_fingerprint(text) == "hello world foo bar"
+    assert normalize_for_fingerprint(" \n\t ") == ""
+    assert normalize_lowered_for_fingerprint(text.lower()) == normalize_for_fingerprint(text)
+
+
+def test_fingerprints_match_hash_of_joined_payload() -> None:
+    text = normalize_for_fingerprint("Héllo  world")
+    expected = dedup._new_hasher(f"@chan\n{text}".encode("utf-8")).hexdigest()
+    assert compute_fingerprint("@chan", text, "per_source") == expected
+    assert compute_fingerprint("@chan", text, "global") == dedup._new_hasher(
+        text.encode("utf-8")
+    ).hexdigest()
+    assert compute_fingerprint("@chan", text, "off") is None
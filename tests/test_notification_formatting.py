@@ -47,3 +47,10 @@ def test_format_source_label_with_base_only_alias() -> None:
     aliases = {"@team": "Team"}
     label = format_source_label(context, aliases)
     assert label.startswith("Team / topic 11")
+
+
+def test_format_source_label_tracks_alias_map() -> None:
+    context = _context(source_key="@team", base_source_key="@team", topic_id=None)
+    assert format_source_label(context, {"@team": "Team"}) == "Team (@team)"
+    assert format_source_label(context, {"@team": "Crew"}) == "Crew (@team)"
+    assert format_source_label(context, {}) == "@team"
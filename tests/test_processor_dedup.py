@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import asyncio
+
+from conftest import FakeNotifier, FakeStorage, _make_context, _make_processor
+from core.config import DedupConfig
+
+
+def _run(mode: str, only_on_match: bool) -> FakeStorage:
+    storage = FakeStorage()
+    processor = _make_processor(
+        storage,
+        FakeNotifier(),
+        dedup_config=DedupConfig(mode=mode, only_on_match=only_on_match, ttl_days=30),
+    )
+    for message_id in (1, 2):
+        asyncio.run(processor.handle(_make_context(message_id=message_id)))
+    return storage
+
+
+def test_repeated_text_is_deduplicated_per_source() -> None:
+    storage = _run("per_source", True)
+    assert len(storage.seen) == 1
+    assert len(storage.saved) == 1
+    assert storage.last_ids["@group"] == 2
+
+
+def test_fingerprints_are_skipped_when_dedup_inactive() -> None:
+    for mode, only_on_match in (("off", True), ("per_source", False)):
+        storage = _run(mode, only_on_match)
+        assert not storage.seen
+        assert len(storage.saved) == 2
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from conftest import FakeNotifier, FakeStorage, _make_context, _make_processor
+
+
+RULES = [
+    {"name": "greet", "keywords": ["hello"], "enabled": True},
+    {"name": "planet", "keywords": ["world"], "enabled": True},
+    {"name": "both", "regex": ["hello\\s+world"], "enabled": True},
+]
+
+
+class FailingNotifier:
+    async def send(self, context, match, snippet: str) -> None:
+        raise RuntimeError("send failed")
+
+
+class InFlightNotifier:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def send(self, context, match, snippet: str) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+
+def test_every_match_is_saved_and_sent() -> None:
+    storage = FakeStorage()
+    notifier = FakeNotifier()
+    processor = _make_processor(storage, notifier, rules=RULES)
+
+    asyncio.run(processor.handle(_make_context(message_id=7)))
+
+    assert sorted(match.rule_name for _, match in storage.saved) == ["both", "greet", "planet"]
+    assert len(notifier.sent) == 3
+    assert storage.last_ids["@group"] == 7
+
+
+def test_failed_send_leaves_last_id_unchanged() -> None:
+    storage = FakeStorage()
+    processor = _make_processor(storage, FailingNotifier(), rules=RULES)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(processor.handle(_make_context(message_id=7)))
+
+    assert len(storage.saved) == 3
+    assert "@group" not in storage.last_ids
+
+
+def test_send_slots_cap_in_flight_notifications() -> None:
+    storage = FakeStorage()
+    notifier = InFlightNotifier()
+    processor = _make_processor(storage, notifier, rules=RULES, max_concurrent_sends=1)
+
+    asyncio.run(processor.handle(_make_context(message_id=7)))
+
+    assert notifier.peak == 1
+    assert storage.last_ids["@group"] == 7
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from core.rules_engine import build_keyword_index, build_rules, compile_pattern, match_rules
+
+
+def test_build_rules_reuses_compiled_patterns() -> None:
+    config = [{"name": "py", "regex": [r"\bpython\b"], "enabled": True}]
+    first = build_rules(config)
+    second = build_rules(config)
+    assert first[0].regex_patterns[0] is second[0].regex_patterns[0]
+    assert first[0].regex_patterns[0] is compile_pattern(r"\bpython\b")
+
+
+def test_compile_pattern_is_case_insensitive() -> None:
+    rules = build_rules([{"name": "py", "regex": [r"\bpython\b"], "enabled": True}])
+    assert [match.rule_name for match in match_rules("PYTHON dev", rules)] == ["py"]
+
+
+def test_compile_pattern_rejects_invalid_regex() -> None:
+    with pytest.raises(re.error):
+        compile_pattern("(unclosed")
+
+
+def test_keyword_index_matches_plain_scan() -> None:
+    rules = build_rules(
+        [
+            {"name": "jobs", "keywords": ["hiring", "remote"], "exclude_keywords": ["unpaid"]},
+            {"name": "remote", "keywords": ["remote"], "regex": [r"\bpython\b"]},
+            {"name": "off", "keywords": ["hiring"], "enabled": False},
+        ]
+    )
+    index = build_keyword_index(rules)
+    for text in ("Hiring REMOTE python devs", "unpaid remote internship", "nothing here"):
+        assert match_rules(text, rules, index) == match_rules(text, rules)
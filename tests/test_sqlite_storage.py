@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+
+from adapters.sqlite_storage import SQLiteStorage
+from core.models import MatchRecord, MessageContext
+
+
+def test_last_ids_are_buffered_until_flush(tmp_path) -> None:
+    db_path = str(tmp_path / "telescope.db")
+    storage = SQLiteStorage(db_path)
+    storage.init_db()
+
+    storage.set_last_id("@group", 5)
+    storage.set_last_id("@group", 7)
+    assert storage.get_last_id("@group") == 7
+    assert storage.list_sources_state() == {"@group"}
+    assert SQLiteStorage(db_path).get_last_id("@group") is None
+
+    storage.flush_last_ids()
+    reopened = SQLiteStorage(db_path)
+    assert reopened.get_last_id("@group") == 7
+    assert reopened.list_sources_state() == {"@group"}
+
+
+def test_save_matches_writes_all_rows(tmp_path) -> None:
+    storage = SQLiteStorage(str(tmp_path / "telescope.db"))
+    storage.init_db()
+    context = MessageContext(
+        source_key="@group",
+        base_source_key="@group",
+        topic_id=None,
+        chat_id=1,
+        message_id=9,
+        date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        text="hello world",
+        permalink="https://t.me/group/9",
+        topic_permalink=None,
+    )
+    records = [
+        MatchRecord(rule_name=name, reason="keyword", text_snippet="hello")
+        for name in ("a", "b")
+    ]
+
+    storage.save_matches(context, records)
+
+    with sqlite3.connect(str(tmp_path / "telescope.db")) as conn:
+        rows = conn.execute("SELECT rule_name, message_id FROM matches ORDER BY id").fetchall()
+    assert rows == [("a", 9), ("b", 9)]
+
+
+def test_try_mark_seen_reports_first_sighting(tmp_path) -> None:
+    storage = SQLiteStorage(str(tmp_path / "telescope.db"))
+    storage.init_db()
+
+    assert storage.try_mark_seen("abc") is True
+    assert storage.try_mark_seen("abc") is False
+    assert storage.is_seen("abc")
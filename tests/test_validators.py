@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from frontend.validators import parse_source_key
+
+
+def test_parse_source_key_normalizes_valid_keys() -> None:
+    assert parse_source_key(" @My_Group ").normalized == "@my_group"
+    assert parse_source_key("@group#topic:12").normalized == "@group#topic:12"
+    assert parse_source_key("chat_id:-100123").normalized == "chat_id:-100123"
+    assert parse_source_key("chat_id:0042").normalized == "chat_id:42"
+    assert parse_source_key("chat_id:-007#topic:3").normalized == "chat_id:-7#topic:3"
+    assert parse_source_key("chat_id:-000").normalized == "chat_id:0"
+
+
+def test_parse_source_key_rejects_invalid_keys() -> None:
+    for raw in ("@", "@bad-name", "@café", "chat_id:", "chat_id:-", "chat_id:1_0", "@a#topic:x"):
+        info = parse_source_key(raw)
+        assert info.normalized is None and info.error, raw
+
+
+def test_parse_source_key_chat_id_is_stricter_than_int() -> None:
+    # int() accepts all of these; the topic suffix keeps the outer strip() away from
+    # the padded values.
+    for chat_value in ("+5", "1_0", " 5", "5 ", "\u0665"):
+        info = parse_source_key(f"chat_id:{chat_value}#topic:1")
+        assert info.normalized is None and info.error == "chat_id must be numeric", chat_value